@@ -29,6 +29,35 @@ def centered1d(x):
 def centered2d(x):
     return (x[1:, 1:] + x[1:, :-1] + x[:-1, 1:] + x[:-1, :-1]) / 4.
 
+def _start_vector(initial_mode_guess, size):
+    """Flatten a mode guess into an ARPACK start vector, dropping it
+    if it was found on a different mesh."""
+    if initial_mode_guess is None:
+        return None
+    v0 = numpy.ravel(initial_mode_guess)
+    if v0.size != size:
+        return None
+    return v0
+
+class _SparsePattern():
+    """
+    The sparsity pattern of a finite difference operator.
+
+    Sorting the COO indices into CSR order only depends on the mesh,
+    so it is done once and reused for every set of matrix values
+    assembled on that mesh (e.g. at each wavelength of a sweep).
+    """
+
+    def __init__(self, I, J):
+        self.order = numpy.lexsort((J, I))
+        self.indices = J[self.order]
+        self.shape = (I.max() + 1, J.max() + 1)
+        self.indptr = numpy.r_[0, numpy.cumsum(numpy.bincount(I, minlength=self.shape[0]))]
+
+    def matrix(self, V):
+        from scipy.sparse import csr_matrix
+        return csr_matrix((V[self.order], self.indices, self.indptr), shape=self.shape)
+
 class _ModeSolverSemiVectorial():
     """
     This function calculates the modes of a dielectric waveguide
@@ -88,18 +117,29 @@ class _ModeSolverSemiVectorial():
         self.wl = wl
         self.x = structure.y
         self.y = structure.x
+        self.epsfunc = structure.eps_func
         self.boundary = boundary
         self.method = method
-        self.structure = structure
+        self._pattern = None
 
-    def build_matrix(self):
+    def update_wavelength(self, wl, structure):
+        """
+        Retarget the solver to a new wavelength on the same mesh.
 
-        from scipy.sparse import coo_matrix
+        The permittivity is resampled from `structure`, which may
+        have changed with the wavelength, but the sparsity pattern
+        assembled for the mesh is kept.
+        """
+        self.wl = wl
+        self.epsfunc = structure.eps_func
+        return self
+
+    def build_matrix(self):
 
         wl = self.wl
         x = self.x
         y = self.y
-        structure = self.structure
+        epsfunc = self.epsfunc
         boundary = self.boundary
         method = self.method
 
@@ -112,7 +152,7 @@ class _ModeSolverSemiVectorial():
         xc = (x[:-1] + x[1:]) / 2
         yc = (y[:-1] + y[1:]) / 2
 
-        eps = structure.eps_func(yc, xc)
+        eps = epsfunc(yc, xc)
         eps = numpy.c_[eps[:, 0:1], eps, eps[:, -1:]]
         eps = numpy.r_[eps[0:1, :], eps, eps[-1:, :]]
 
@@ -228,11 +268,13 @@ class _ModeSolverSemiVectorial():
         i_e = ii[1:, :].flatten()
         i_w = ii[:-1, :].flatten()
 
-        I = numpy.r_[iall, i_w, i_e, i_s, i_n]
-        J = numpy.r_[iall, i_e, i_w, i_n, i_s]
+        if self._pattern is None:
+            I = numpy.r_[iall, i_w, i_e, i_s, i_n]
+            J = numpy.r_[iall, i_e, i_w, i_n, i_s]
+            self._pattern = _SparsePattern(I, J)
         V = numpy.r_[Ap[iall], Ae[i_w], Aw[i_e], An[i_s], As[i_n]]
 
-        A = coo_matrix((V, (I, J))).tocsr()
+        A = self._pattern.matrix(V)
 
         return A
 
@@ -244,6 +286,7 @@ class _ModeSolverSemiVectorial():
         self.tol = tol
 
         A = self.build_matrix()
+        initial_mode_guess = _start_vector(initial_mode_guess, A.shape[0])
 
         eigs = eigen.eigs(A,
                           k=neigs,
@@ -336,10 +379,21 @@ class _ModeSolverVectorial():
         self.y = structure.x
         self.epsfunc = structure.eps_func
         self.boundary = boundary
+        self._pattern = None
 
-    def build_matrix(self):
+    def update_wavelength(self, wl, structure):
+        """
+        Retarget the solver to a new wavelength on the same mesh.
 
-        from scipy.sparse import coo_matrix
+        The permittivity is resampled from `structure`, which may
+        have changed with the wavelength, but the sparsity pattern
+        assembled for the mesh is kept.
+        """
+        self.wl = wl
+        self.epsfunc = structure.eps_func
+        return self
+
+    def build_matrix(self, k=None):
 
         wl = self.wl
         x = self.x
@@ -373,7 +427,8 @@ class _ModeSolverVectorial():
         self.nx = nx
         self.ny = ny
 
-        k = 2 * numpy.pi / wl
+        if k is None:
+            k = 2 * numpy.pi / wl
 
         ones_nx = numpy.ones((nx, 1))
         ones_ny = numpy.ones((1, ny))
@@ -618,37 +673,57 @@ class _ModeSolverVectorial():
         i_sw = ii[:-1, :-1].flatten()
         i_nw = ii[:-1, 1:].flatten()
 
-        Ixx = numpy.r_[iall, i_w, i_e, i_s, i_n, i_ne, i_se, i_sw, i_nw]
-        Jxx = numpy.r_[iall, i_e, i_w, i_n, i_s, i_sw, i_nw, i_ne, i_se]
+        if self._pattern is None:
+            Ixx = numpy.r_[iall, i_w, i_e, i_s, i_n, i_ne, i_se, i_sw, i_nw]
+            Jxx = numpy.r_[iall, i_e, i_w, i_n, i_s, i_sw, i_nw, i_ne, i_se]
+
+            Ixy = numpy.r_[iall, i_w, i_e, i_s, i_n, i_ne, i_se, i_sw, i_nw]
+            Jxy = numpy.r_[
+                iall, i_e, i_w, i_n, i_s, i_sw, i_nw, i_ne, i_se] + nx * ny
+
+            Iyx = numpy.r_[
+                iall, i_w, i_e, i_s, i_n, i_ne, i_se, i_sw, i_nw] + nx * ny
+            Jyx = numpy.r_[iall, i_e, i_w, i_n, i_s, i_sw, i_nw, i_ne, i_se]
+
+            Iyy = numpy.r_[
+                iall, i_w, i_e, i_s, i_n, i_ne, i_se, i_sw, i_nw] + nx * ny
+            Jyy = numpy.r_[
+                iall, i_e, i_w, i_n, i_s, i_sw, i_nw, i_ne, i_se] + nx * ny
+
+            I = numpy.r_[Ixx, Ixy, Iyx, Iyy]
+            J = numpy.r_[Jxx, Jxy, Jyx, Jyy]
+            self._pattern = _SparsePattern(I, J)
+
         Vxx = numpy.r_[axxp[iall], axxe[i_w], axxw[i_e], axxn[i_s], axxs[
             i_n], axxsw[i_ne], axxnw[i_se], axxne[i_sw], axxse[i_nw]]
-
-        Ixy = numpy.r_[iall, i_w, i_e, i_s, i_n, i_ne, i_se, i_sw, i_nw]
-        Jxy = numpy.r_[
-            iall, i_e, i_w, i_n, i_s, i_sw, i_nw, i_ne, i_se] + nx * ny
         Vxy = numpy.r_[axyp[iall], axye[i_w], axyw[i_e], axyn[i_s], axys[
             i_n], axysw[i_ne], axynw[i_se], axyne[i_sw], axyse[i_nw]]
-
-        Iyx = numpy.r_[
-            iall, i_w, i_e, i_s, i_n, i_ne, i_se, i_sw, i_nw] + nx * ny
-        Jyx = numpy.r_[iall, i_e, i_w, i_n, i_s, i_sw, i_nw, i_ne, i_se]
         Vyx = numpy.r_[ayxp[iall], ayxe[i_w], ayxw[i_e], ayxn[i_s], ayxs[
             i_n], ayxsw[i_ne], ayxnw[i_se], ayxne[i_sw], ayxse[i_nw]]
-
-        Iyy = numpy.r_[
-            iall, i_w, i_e, i_s, i_n, i_ne, i_se, i_sw, i_nw] + nx * ny
-        Jyy = numpy.r_[
-            iall, i_e, i_w, i_n, i_s, i_sw, i_nw, i_ne, i_se] + nx * ny
         Vyy = numpy.r_[ayyp[iall], ayye[i_w], ayyw[i_e], ayyn[i_s], ayys[
             i_n], ayysw[i_ne], ayynw[i_se], ayyne[i_sw], ayyse[i_nw]]
 
-        I = numpy.r_[Ixx, Ixy, Iyx, Iyy]
-        J = numpy.r_[Jxx, Jxy, Jyx, Jyy]
         V = numpy.r_[Vxx, Vxy, Vyx, Vyy]
-        A = coo_matrix((V, (I, J))).tocsr()
+        A = self._pattern.matrix(V)
 
         return A
 
+    def assemble_operators(self):
+        """
+        Assemble the wavelength-independent parts of the operator.
+
+        For a fixed permittivity the operator is affine in k**2,
+        A(k) = A0 + k**2 * M, so it can be formed at any wavelength
+        without rebuilding it.
+
+        Returns
+        -------
+        (A0, M) : tuple of CSR matrices
+        """
+        A0 = self.build_matrix(k=0.)
+        M = self.build_matrix(k=1.) - A0
+        return A0, M
+
     def compute_other_fields(self, neffs, Hxs, Hys):
 
         from scipy.sparse import coo_matrix
@@ -923,7 +998,7 @@ class _ModeSolverVectorial():
 
         return (Hzs, Exs, Eys, Ezs)
 
-    def solve(self, neigs=4, tol=0, guess=None, mode_profiles=True, initial_mode_guess=None):
+    def solve(self, neigs=4, tol=0, guess=None, mode_profiles=True, initial_mode_guess=None, A=None):
         """
         This function finds the eigenmodes.
 
@@ -936,6 +1011,9 @@ class _ModeSolverVectorial():
         guess : float
             a guess for the refractive index. Only finds eigenvectors with an effective refractive index
             higher than this value.
+        A : sparse matrix
+            a prebuilt operator at the solver's wavelength, e.g. from `assemble_operators`. If `None`,
+            the operator is built from the structure.
 
         Returns
         -------
@@ -952,7 +1030,9 @@ class _ModeSolverVectorial():
         self.nmodes = neigs
         self.tol = tol
 
-        A = self.build_matrix()
+        if A is None:
+            A = self.build_matrix()
+        initial_mode_guess = _start_vector(initial_mode_guess, A.shape[0])
 
         if guess is not None:
             # calculate shift for eigs function
@@ -1013,21 +1093,23 @@ class FDMode():
         self.x = x
         self.y = y
         self.neff = neff
-        self.Ex = Ex
-        self.Ey = Ey
-        self.Ez = Ez
-        self.Hx = Hx
-        self.Hy = Hy
-        self.Hz = Hz
-
-        self.fields = col.OrderedDict({
-            'Ex': Ex,
-            'Ey': Ey,
-            'Ez': Ez,
-            'Hx': Hx,
-            'Hy': Hy,
-            'Hz': Hz
-        })
+
+        # Each field's components are kept in one contiguous block and
+        # exposed as views into it.  E lives on the cell centres and H on
+        # the nodes, so the two blocks have different shapes.
+        self._e = numpy.array([Ex, Ey, Ez])
+        self._h = numpy.array([Hx, Hy, Hz])
+        self.Ex, self.Ey, self.Ez = self._e
+        self.Hx, self.Hy, self.Hz = self._h
+
+        self.fields = col.OrderedDict((
+            ('Ex', self.Ex),
+            ('Ey', self.Ey),
+            ('Ez', self.Ez),
+            ('Hx', self.Hx),
+            ('Hy', self.Hy),
+            ('Hz', self.Hz),
+        ))
 
     def norm(self):
         x = centered1d(self.x)
@@ -1036,12 +1118,8 @@ class FDMode():
 
     def normalize(self):
         n = self.norm()
-        self.Ex /= n
-        self.Ey /= n
-        self.Ez /= n
-        self.Hx /= n
-        self.Hy /= n
-        self.Hz /= n
+        self._e /= n
+        self._h /= n
 
         return self
 
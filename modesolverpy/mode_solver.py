@@ -1,12 +1,14 @@
 from __future__ import absolute_import
 import abc
+import copy
 import os
 import sys
 import subprocess
-import copy
 import tqdm
 import time
+import tempfile
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from six import with_metaclass
 
 from . import _mode_solver_lib as ms
@@ -24,6 +26,13 @@ except:
     from matplotlib.figure import Figure
     MPL = True
 
+try:
+    from numba import njit
+
+    NUMBA = True
+except ImportError:
+    NUMBA = False
+
 def use_gnuplot():
     """
     Use gnuplot as the plotting tool for any mode related outputs.
@@ -42,6 +51,66 @@ def use_matplotlib():
     global MPL
     MPL = True
 
+# Tile size for the numba |F|^2 reduction; a 64x64 complex128 tile is 64 KB,
+# small enough to stay cache resident while it is squared and summed.
+_TILE = 64
+
+if NUMBA:
+
+    @njit(fastmath=True, cache=True)
+    def _sum_abs2(fields):
+        """
+        Sum :math:`|F|^2` over the last two axes of a
+        (components, y, x) complex array.
+        """
+        n_comps, ny, nx = fields.shape
+        out = np.zeros(n_comps)
+        for k in range(n_comps):
+            s = 0.0
+            for jb in range(0, ny, _TILE):
+                for ib in range(0, nx, _TILE):
+                    for j in range(jb, min(jb + _TILE, ny)):
+                        for i in range(ib, min(ib + _TILE, nx)):
+                            z = fields[k, j, i]
+                            s += z.real * z.real + z.imag * z.imag
+            out[k] = s
+        return out
+
+else:
+
+    def _sum_abs2(fields):
+        """
+        Sum :math:`|F|^2` over the last two axes of a
+        (components, y, x) complex array.
+        """
+        # `vdot` conjugates its first argument, so this is one BLAS dot
+        # product per component, with no temporary arrays.
+        return np.array([np.vdot(f, f).real for f in fields])
+
+def _gnuplot_value(value):
+    # Format a Python value as the right-hand side of a gnuplot assignment.
+    # Strings are double-quoted so that titles can carry newlines.
+    if isinstance(value, str):
+        value = value.replace("\\", "\\\\").replace('"', '\\"')
+        return '"%s"' % value.replace("\n", "\\n")
+    return str(value)
+
+def _solve_sweep_step(solver, structure, wavelength=None, full_state=False):
+    """
+    Solve a single step of a sweep.
+
+    This lives at module level so that it can be pickled and
+    dispatched to worker processes.  Each worker solves with its
+    own copy of `solver` and returns it, stripped of the mode
+    profiles and structure unless `full_state` is `True`.
+    """
+    if wavelength is not None:
+        structure.change_wavelength(wavelength)
+    solver.solve(structure)
+    if full_state:
+        return solver
+    return solver._stripped()
+
 class _ModeSolver(with_metaclass(abc.ABCMeta)):
     def __init__(
         self,
@@ -57,6 +126,9 @@ class _ModeSolver(with_metaclass(abc.ABCMeta)):
         self._boundary = boundary
         self._mode_profiles = mode_profiles
         self._initial_mode_guess = initial_mode_guess
+        # `_initial_mode_guess` is overwritten by every solve, so keep
+        # the caller's guess to restart cold sweeps from.
+        self._user_initial_mode_guess = initial_mode_guess
         self._n_eff_guess = n_eff_guess
 
         self.n_effs = None
@@ -64,16 +136,59 @@ class _ModeSolver(with_metaclass(abc.ABCMeta)):
         self.mode_types = None
         self.overlaps = None
 
+        self._structure = None
+        self._wavelength = None
+        self._ms = None
+
         self._path = os.path.dirname(sys.modules[__name__].__file__) + "/"
 
+    def __getstate__(self):
+        # The underlying solver keeps the structure's permittivity
+        # interpolator, which can't be pickled.  Everything needed
+        # after a solve is mirrored onto `self`, so drop it.
+        state = self.__dict__.copy()
+        state["_ms"] = None
+        return state
+
+    def _stripped(self):
+        # A shallow copy without the bulky per-solve state, for
+        # shipping to and from worker processes.
+        solver = copy.copy(self)
+        solver._ms = None
+        solver._structure = None
+        solver.modes = None
+        solver._initial_mode_guess = self._user_initial_mode_guess
+        return solver
+
     @abc.abstractproperty
     def _modes_directory(self):
         pass
 
     @abc.abstractmethod
-    def _solve(self, structure, wavelength):
+    def _new_mode_solver(self, structure, wavelength):
+        pass
+
+    @abc.abstractmethod
+    def _run_mode_solver(self, mode_solver, initial_mode_guess):
+        pass
+
+    @abc.abstractmethod
+    def _set_solution(self, structure, mode_solver):
         pass
 
+    def _solve(self, structure, wavelength):
+        if self._ms is not None and self._structure is structure:
+            # Same mesh as the last solve, so keep the sparsity pattern
+            # already assembled for it.
+            mode_solver = self._ms.update_wavelength(wavelength, structure)
+        else:
+            mode_solver = self._new_mode_solver(structure, wavelength)
+        self._run_mode_solver(mode_solver, self._initial_mode_guess)
+        self._structure = structure
+        self._wavelength = wavelength
+        self._ms = mode_solver
+        return self._set_solution(structure, mode_solver)
+
     def solve(self, structure):
         """
         Find the modes of a given structure.
@@ -90,6 +205,51 @@ class _ModeSolver(with_metaclass(abc.ABCMeta)):
         """
         return self._solve(structure, structure._wl)
 
+    def _sweep(
+        self, structures, wavelengths=None, n_workers=None, warm_start=True
+    ):
+        """
+        Solve each step of a sweep, yielding a solved solver per step.
+
+        If `n_workers` is `None` the steps are solved serially by
+        `self`, each starting from the previous step's fundamental
+        mode, or from the `initial_mode_guess` given to the constructor
+        if `warm_start` is `False`.  Otherwise they are spread
+        over a pool of `n_workers` processes, each step starting from
+        the constructor's `initial_mode_guess`.  Each step then yields a
+        copy of the solver holding that step's effective indices, mode
+        types and overlaps, but not its mode profiles.  Once the sweep
+        completes `self` takes on the full state of the final step, as
+        it would have serially, except that `self._structure` is the
+        worker's copy of the final structure rather than the caller's.
+        """
+        structures = list(structures)
+        if wavelengths is None:
+            wavelengths = [None] * len(structures)
+
+        if n_workers is None:
+            for s, w in tqdm.tqdm(
+                zip(structures, wavelengths), total=len(structures), ncols=70
+            ):
+                if not warm_start:
+                    self._initial_mode_guess = self._user_initial_mode_guess
+                yield _solve_sweep_step(self, s, w)
+        else:
+            solver = None
+            with ProcessPoolExecutor(max_workers=n_workers) as ex:
+                n = len(structures)
+                solved = ex.map(
+                    _solve_sweep_step,
+                    [self._stripped()] * n,
+                    structures,
+                    wavelengths,
+                    [False] * (n - 1) + [True],
+                )
+                for solver in tqdm.tqdm(solved, total=n, ncols=70):
+                    yield solver
+            if solver is not None:
+                self.__dict__.update(solver.__dict__)
+
     def solve_sweep_structure(
         self,
         structures,
@@ -98,6 +258,8 @@ class _ModeSolver(with_metaclass(abc.ABCMeta)):
         plot=True,
         x_label="Structure number",
         fraction_mode_list=[],
+        n_workers=None,
+        warm_start=True,
     ):
         """
         Find the modes of many structures.
@@ -116,6 +278,18 @@ class _ModeSolver(with_metaclass(abc.ABCMeta)):
                 that should be included in the TE/TM mode fraction plot.
                 If the list is empty, all modes will be included.  The list
                 is empty by default.
+            n_workers (int): The number of processes to solve the
+                structures with.  If `None`, the structures are solved
+                serially in this process.  After a parallel sweep the
+                solver's structure is a worker's copy of the last one.
+                Default is `None`.
+            warm_start (bool): `True` if each structure should be
+                solved starting from the fundamental mode found for the
+                previous one, otherwise `False`, in which case each
+                starts from the constructor's `initial_mode_guess`.  Only
+                applies to serial sweeps, and only the semi-vectorial
+                solver solving for a single mode warm-starts.  Default
+                is `True`.
 
         Returns:
             list: A list of the effective indices found for each structure.
@@ -124,12 +298,13 @@ class _ModeSolver(with_metaclass(abc.ABCMeta)):
         mode_types = []
         fractions_te = []
         fractions_tm = []
-        for s in tqdm.tqdm(structures, ncols=70):
-            self.solve(s)
-            n_effs.append(np.real(self.n_effs))
-            mode_types.append(self._get_mode_types())
-            fractions_te.append(self.fraction_te)
-            fractions_tm.append(self.fraction_tm)
+        for solver in self._sweep(
+            structures, n_workers=n_workers, warm_start=warm_start
+        ):
+            n_effs.append(np.real(solver.n_effs))
+            mode_types.append(solver._get_mode_types())
+            fractions_te.append(solver.fraction_te)
+            fractions_tm.append(solver.fraction_tm)
 
         if filename:
             self._write_n_effs_to_file(
@@ -198,6 +373,8 @@ class _ModeSolver(with_metaclass(abc.ABCMeta)):
         wavelengths,
         filename="wavelength_n_effs.dat",
         plot=True,
+        n_workers=None,
+        warm_start=True,
     ):
         """
         Solve for the effective indices of a fixed structure at
@@ -212,16 +389,35 @@ class _ModeSolver(with_metaclass(abc.ABCMeta)):
                 effective indices.  Defaults to 'wavelength_n_effs.dat'.
             plot (bool): `True` if plots should be generates,
                 otherwise `False`.  Default is `True`.
+            n_workers (int): The number of processes to solve the
+                wavelengths with.  If `None`, the wavelengths are solved
+                serially in this process.  After a parallel sweep the
+                solver's structure is a worker's copy of the last one.
+                Default is `None`.
+            warm_start (bool): `True` if each wavelength should be
+                solved starting from the fundamental mode found at the
+                previous one, otherwise `False`, in which case each
+                starts from the constructor's `initial_mode_guess`.  Only
+                applies to serial sweeps, and only the semi-vectorial
+                solver solving for a single mode warm-starts.  Default
+                is `True`.
 
         Returns:
             list: A list of the effective indices found for each wavelength.
         """
         n_effs = []
-        for w in tqdm.tqdm(wavelengths, ncols=70):
-            structure.change_wavelength(w)
-            self.solve(structure)
-            n_effs.append(np.real(self.n_effs))
+        wavelengths = list(wavelengths)
+        structures = [structure] * len(wavelengths)
+        for solver in self._sweep(
+            structures, wavelengths, n_workers, warm_start
+        ):
+            n_effs.append(np.real(solver.n_effs))
+
+        self._write_wavelength_sweep(n_effs, wavelengths, filename, plot)
 
+        return n_effs
+
+    def _write_wavelength_sweep(self, n_effs, wavelengths, filename, plot):
         if filename:
             self._write_n_effs_to_file(
                 n_effs, self._modes_directory + filename, wavelengths
@@ -241,8 +437,6 @@ class _ModeSolver(with_metaclass(abc.ABCMeta)):
                     title,
                 )
 
-        return n_effs
-
     def solve_ng(self, structure, wavelength_step=0.01, filename="ng.dat"):
         r"""
         Solve for the group index, :math:`n_g`, of a structure at a particular
@@ -264,21 +458,19 @@ class _ModeSolver(with_metaclass(abc.ABCMeta)):
         wl_nom = structure._wl
 
         self.solve(structure)
-        n_ctrs = self.n_effs
+        n_ctrs = np.asarray(self.n_effs)
 
         structure.change_wavelength(wl_nom - wavelength_step)
         self.solve(structure)
-        n_bcks = self.n_effs
+        n_bcks = np.asarray(self.n_effs)
 
         structure.change_wavelength(wl_nom + wavelength_step)
         self.solve(structure)
-        n_frws = self.n_effs
+        n_frws = np.asarray(self.n_effs)
 
-        n_gs = []
-        for n_ctr, n_bck, n_frw in zip(n_ctrs, n_bcks, n_frws):
-            n_gs.append(
-                n_ctr - wl_nom * (n_frw - n_bck) / (2 * wavelength_step)
-            )
+        n_gs = (
+            n_ctrs - wl_nom * (n_frws - n_bcks) / (2 * wavelength_step)
+        ).tolist()
 
         if filename:
             with open(self._modes_directory + filename, "w") as fs:
@@ -288,8 +480,8 @@ class _ModeSolver(with_metaclass(abc.ABCMeta)):
 
         return n_gs
 
-    def _get_mode_filename(self, field_name, mode_number, filename):
-        filename_prefix, filename_ext = os.path.splitext(filename)
+    def _get_mode_filename(self, field_name, mode_number, filename_parts):
+        filename_prefix, filename_ext = filename_parts
         filename_mode = (
             filename_prefix
             + "_"
@@ -301,22 +493,33 @@ class _ModeSolver(with_metaclass(abc.ABCMeta)):
         return filename_mode
 
     def _write_n_effs_to_file(self, n_effs, filename, x_vals=None):
-        with open(filename, "w") as fs:
-            fs.write('# Sweep param, mode 1, mode 2, ...\n')
-            for i, n_eff in enumerate(n_effs):
-                if x_vals is not None:
-                    line_start = str(x_vals[i]) + ","
-                else:
-                    line_start = ""
-                line = ",".join([str(np.round(n, 3)) for n in n_eff])
-                fs.write(line_start + line + "\n")
+        data = np.real(np.asarray(n_effs))
+        fmt = ["%.3f"] * data.shape[1]
+        if x_vals is not None:
+            # Write the sweep parameters as given; they needn't be floats.
+            rows = np.empty((data.shape[0], data.shape[1] + 1), dtype=object)
+            rows[:, 0] = [str(x) for x in x_vals]
+            rows[:, 1:] = data
+            data = rows
+            fmt = ["%s"] + fmt
+        np.savetxt(
+            filename,
+            data,
+            fmt=fmt,
+            delimiter=",",
+            header="Sweep param, mode 1, mode 2, ...",
+        )
         return n_effs
 
     def _write_mode_to_file(self, mode, filename):
-        with open(filename, "w") as fs:
-            for e in mode[::-1]:
-                e_str = ",".join([str(v) for v in e])
-                fs.write(e_str + "\n")
+        mode = np.asarray(mode)
+        if np.iscomplexobj(mode):
+            # Keep the `(a+bj)` form rather than savetxt's split columns.
+            np.savetxt(
+                filename, mode[::-1].astype(object), fmt="%s", delimiter=","
+            )
+        else:
+            np.savetxt(filename, mode[::-1], fmt="%.6g", delimiter=",")
         return mode
 
     def _plot_n_effs(self, filename_n_effs, filename_te_fractions, xlabel, ylabel, title):
@@ -384,7 +587,7 @@ class _ModeSolver(with_metaclass(abc.ABCMeta)):
 
         return args
 
-    def _plot_mode(
+    def _mode_plot_args(
         self,
         field_name,
         mode_number,
@@ -419,11 +622,8 @@ class _ModeSolver(with_metaclass(abc.ABCMeta)):
             else:
                 title += ", A_%s: " % field_name[1] + "{:.1f}\%".format(area)
 
-        if subtitle:
-            if MPL:
-                title2 = "\n$%s$" % subtitle
-            else:
-                title += "\n{/*0.7 %s}" % subtitle
+        if subtitle and not MPL:
+            title += "\n{/*0.7 %s}" % subtitle
 
         args = {
             "title": title,
@@ -447,6 +647,37 @@ class _ModeSolver(with_metaclass(abc.ABCMeta)):
         filename_image = filename_image_prefix + ".png"
         args["filename_image"] = filename_image
 
+        return args
+
+    def _plot_mode(
+        self,
+        field_name,
+        mode_number,
+        filename_mode,
+        n_eff=None,
+        subtitle="",
+        e2_x=0.0,
+        e2_y=0.0,
+        ctr_x=0.0,
+        ctr_y=0.0,
+        area=None,
+        wavelength=None,
+    ):
+        args = self._mode_plot_args(
+            field_name,
+            mode_number,
+            filename_mode,
+            n_eff,
+            subtitle,
+            e2_x,
+            e2_y,
+            ctr_x,
+            ctr_y,
+            area,
+            wavelength,
+        )
+        title = args["title"]
+
         if MPL:
             heatmap = np.loadtxt(filename_mode, delimiter=",")
 
@@ -455,7 +686,7 @@ class _ModeSolver(with_metaclass(abc.ABCMeta)):
             plt.suptitle(title)
             if subtitle:
                 plt.rcParams.update({"axes.titlesize": "small"})
-                plt.title(title2)
+                plt.title("\n$%s$" % subtitle)
             plt.xlabel("x")
             plt.ylabel("y")
             plt.imshow(
@@ -478,10 +709,46 @@ class _ModeSolver(with_metaclass(abc.ABCMeta)):
             return modeplot
         else:
             gp.gnuplot(self._path + "mode.gpi", args)
-            gp.trim_pad_image(filename_image)
+            gp.trim_pad_image(args["filename_image"])
 
         return args
 
+    def _plot_modes(self, plots):
+        """
+        Plot many mode profiles.
+
+        `plots` is a list of keyword-argument dicts for `_plot_mode`.
+        With gnuplot, all of the plots are rendered by a single
+        generated script, so gnuplot is only started once, and the
+        images are then trimmed concurrently.
+
+        Returns:
+            list: What `_plot_mode` would have returned for each plot.
+        """
+        if MPL or not plots:
+            return [self._plot_mode(**kwargs) for kwargs in plots]
+
+        args_list = [self._mode_plot_args(**kwargs) for kwargs in plots]
+        filename_gpi = self._path + "mode.gpi"
+
+        fd, filename_script = tempfile.mkstemp(suffix=".gpi")
+        with os.fdopen(fd, "w") as fs:
+            for args in args_list:
+                fs.write("reset\n")
+                for name, value in args.items():
+                    fs.write("%s = %s\n" % (name, _gnuplot_value(value)))
+                fs.write("load %s\n" % _gnuplot_value(filename_gpi))
+        try:
+            gp.gnuplot(filename_script)
+        finally:
+            os.remove(filename_script)
+
+        with ThreadPoolExecutor() as ex:
+            filenames_image = [args["filename_image"] for args in args_list]
+            list(ex.map(gp.trim_pad_image, filenames_image))
+
+        return args_list
+
 
 class ModeSolverSemiVectorial(_ModeSolver):
     """
@@ -525,30 +792,37 @@ class ModeSolverSemiVectorial(_ModeSolver):
     @property
     def _modes_directory(self):
         modes_directory = "./modes_semi_vec/"
-        if not os.path.exists(modes_directory):
-            os.mkdir(modes_directory)
+        os.makedirs(modes_directory, exist_ok=True)
         _modes_directory = modes_directory
         return _modes_directory
 
-    def _solve(self, structure, wavelength):
-        self._structure = structure
-        self._ms = ms._ModeSolverSemiVectorial(
+    def _new_mode_solver(self, structure, wavelength):
+        return ms._ModeSolverSemiVectorial(
             wavelength, structure, self._boundary, self._semi_vectorial_method
         )
-        self._ms.solve(
+
+    def _run_mode_solver(self, mode_solver, initial_mode_guess):
+        return mode_solver.solve(
             self._n_eigs,
             self._tol,
             self._mode_profiles,
-            initial_mode_guess=self._initial_mode_guess,
+            initial_mode_guess=initial_mode_guess,
         )
+
+    def _set_solution(self, structure, mode_solver):
         self.n_effs = self._ms.neff
 
         r = {"n_effs": self.n_effs}
 
         if self._mode_profiles:
+            mode_0 = np.real(self._ms.modes[0])
+            self._ms.modes[0] = mode_0
+            # Started from the fundamental mode, ARPACK only explores
+            # modes of the same symmetry, so it's only a safe guess
+            # when that's the one mode being solved for.
+            if self._n_eigs == 1:
+                self._initial_mode_guess = mode_0
             r["modes"] = self._ms.modes
-            self._ms.modes[0] = np.real(self._ms.modes[0])
-            self._initial_mode_guess = np.real(self._ms.modes[0])
 
         self.modes = self._ms.modes
 
@@ -576,17 +850,22 @@ class ModeSolverSemiVectorial(_ModeSolver):
             and mode field profiles (if solved for).
         """
         modes_directory = "./modes_semi_vec/"
-        if not os.path.isdir(modes_directory):
-            os.mkdir(modes_directory)
+        os.makedirs(modes_directory, exist_ok=True)
         filename = modes_directory + filename
 
-        for i, mode in enumerate(self._ms.modes):
+        filename_parts = os.path.splitext(filename)
+
+        plots = []
+        profile = None
+        for i, mode in enumerate(self.modes):
             filename_mode = self._get_mode_filename(
-                self._semi_vectorial_method, i, filename
+                self._semi_vectorial_method, i, filename_parts
             )
-            self._write_mode_to_file(np.real(mode), filename_mode)
+            if profile is None:
+                profile = np.empty(np.shape(mode), dtype=np.float32)
+            np.copyto(profile, np.real(mode), casting="same_kind")
+            self._write_mode_to_file(profile, filename_mode)
 
-            plots = []
             if plot:
                 if i == 0 and analyse:
                     A, centre, sigma_2 = anal.fit_gaussian(
@@ -596,26 +875,27 @@ class ModeSolverSemiVectorial(_ModeSolver):
                         "E_{max} = %.3f, (x_{max}, y_{max}) = (%.3f, %.3f), MFD_{x} = %.3f, "
                         "MFD_{y} = %.3f"
                     ) % (A, centre[0], centre[1], sigma_2[0], sigma_2[1])
-                    plots.append(self._plot_mode(
-                        self._semi_vectorial_method,
-                        i,
-                        filename_mode,
-                        self.n_effs[i],
-                        subtitle,
-                        sigma_2[0],
-                        sigma_2[1],
-                        centre[0],
-                        centre[1],
-                        wavelength=self._structure._wl,
+                    plots.append(dict(
+                        field_name=self._semi_vectorial_method,
+                        mode_number=i,
+                        filename_mode=filename_mode,
+                        n_eff=self.n_effs[i],
+                        subtitle=subtitle,
+                        e2_x=sigma_2[0],
+                        e2_y=sigma_2[1],
+                        ctr_x=centre[0],
+                        ctr_y=centre[1],
+                        wavelength=self._wavelength,
                     ))
                 else:
-                    plots.append(self._plot_mode(
-                        self._semi_vectorial_method,
-                        i,
-                        filename_mode,
-                        self.n_effs[i],
-                        wavelength=self._structure._wl,
+                    plots.append(dict(
+                        field_name=self._semi_vectorial_method,
+                        mode_number=i,
+                        filename_mode=filename_mode,
+                        n_eff=self.n_effs[i],
+                        wavelength=self._wavelength,
                     ))
+        plots = self._plot_modes(plots)
         print("returning mode plots...")
         return plots
         #return self.modes
@@ -658,22 +938,22 @@ class ModeSolverFullyVectorial(_ModeSolver):
     @property
     def _modes_directory(self):
         modes_directory = "./modes_full_vec/"
-        if not os.path.exists(modes_directory):
-            os.mkdir(modes_directory)
+        os.makedirs(modes_directory, exist_ok=True)
         _modes_directory = modes_directory
         return _modes_directory
 
-    def _solve(self, structure, wavelength):
-        self._structure = structure
-        self._ms = ms._ModeSolverVectorial(
-            wavelength, structure, self._boundary
-        )
-        self._ms.solve(
+    def _new_mode_solver(self, structure, wavelength):
+        return ms._ModeSolverVectorial(wavelength, structure, self._boundary)
+
+    def _run_mode_solver(self, mode_solver, initial_mode_guess):
+        return mode_solver.solve(
             self._n_eigs,
             self._tol,
             self._n_eff_guess,
-            initial_mode_guess=self._initial_mode_guess,
+            initial_mode_guess=initial_mode_guess,
         )
+
+    def _set_solution(self, structure, mode_solver):
         self.n_effs = self._ms.neff
 
         r = {"n_effs": self.n_effs}
@@ -684,19 +964,83 @@ class ModeSolverFullyVectorial(_ModeSolver):
         )
         self.mode_types = self._get_mode_types()
 
+        # Don't seed the next solve with this one's fundamental mode;
+        # started from it, ARPACK misses higher-order modes.
         self._initial_mode_guess = None
 
         self.n_effs_te, self.n_effs_tm = self._sort_neffs(self._ms.neff)
 
         return r
 
+    def solve_sweep_wavelength_fast(
+        self,
+        structure,
+        wavelengths,
+        filename="wavelength_n_effs.dat",
+        plot=True,
+        warm_start=True,
+    ):
+        """
+        Solve for the effective indices of a fixed structure at
+        different wavelengths, assembling the operator only once.
+
+        Unlike :meth:`solve_sweep_wavelength`, the refractive index
+        profile is held at the structure's current wavelength, i.e.
+        material dispersion is ignored.  This lets the operator be
+        split into wavelength-independent parts once and recombined
+        for each wavelength rather than rebuilt.
+
+        Args:
+            structure (Structure): The target structure to solve
+                for modes.
+            wavelengths (list): A list of wavelengths to sweep
+                over.
+            filename (str): The nominal filename to use when saving the
+                effective indices.  Defaults to 'wavelength_n_effs.dat'.
+            plot (bool): `True` if plots should be generates,
+                otherwise `False`.  Default is `True`.
+            warm_start (bool): `True` if each wavelength should be
+                solved starting from the guess left by the previous one,
+                otherwise `False`, in which case each starts from the
+                constructor's `initial_mode_guess`.  Default is `True`.
+
+        Returns:
+            list: A list of the effective indices found for each wavelength.
+        """
+        wavelengths = list(wavelengths)
+        mode_solver = self._new_mode_solver(structure, structure._wl)
+        A0, M = mode_solver.assemble_operators()
+
+        n_effs = []
+        for w in tqdm.tqdm(wavelengths, ncols=70):
+            if not warm_start:
+                self._initial_mode_guess = self._user_initial_mode_guess
+            k = 2 * np.pi / w
+            mode_solver.wl = w
+            mode_solver.solve(
+                self._n_eigs,
+                self._tol,
+                self._n_eff_guess,
+                initial_mode_guess=self._initial_mode_guess,
+                A=A0 + k ** 2 * M,
+            )
+            # The structure stays at its own wavelength, so record the
+            # one actually solved at for labelling the modes.
+            self._structure = structure
+            self._wavelength = w
+            self._ms = mode_solver
+            self._set_solution(structure, mode_solver)
+            n_effs.append(np.real(self.n_effs))
+
+        self._write_wavelength_sweep(n_effs, wavelengths, filename, plot)
+
+        return n_effs
+
     def _get_mode_types(self):
-        mode_types = []
-        labels = {0: "qTE", 1: "qTM", 2: "qTE/qTM"}
-        for overlap in self.overlaps:
-            idx = np.argmax(overlap[0:3])
-            mode_types.append((labels[idx], np.round(overlap[idx], 2)))
-        return mode_types
+        labels = np.array(["qTE", "qTM", "qTE/qTM"])
+        idx = np.argmax(self.overlaps[:, 0:3], axis=1)
+        percentages = np.round(self.overlaps[np.arange(len(idx)), idx], 2)
+        return list(zip(labels[idx].tolist(), percentages.tolist()))
 
     def _sort_neffs(self, n_effs):
         mode_types = self._get_mode_types()
@@ -713,29 +1057,20 @@ class ModeSolverFullyVectorial(_ModeSolver):
         return n_effs_te, n_effs_tm
 
     def _get_overlaps(self, fields):
-        mode_areas = []
-        fraction_te = []
-        fraction_tm = []
-        for mode in self._ms.modes:
-            e_fields = (mode.fields["Ex"], mode.fields["Ey"], mode.fields["Ez"])
-            h_fields = (mode.fields["Hx"], mode.fields["Hy"], mode.fields["Hz"])
+        # Each mode already holds its E- and H-fields as contiguous
+        # (3, y, x) blocks, so reduce those in place.
+        areas_e = np.array([_sum_abs2(m._e) for m in fields])
+        areas_e *= 100.0 / areas_e.sum(axis=1, keepdims=True)
 
-            areas_e = [np.sum(np.abs(e) ** 2) for e in e_fields]
-            areas_e /= np.sum(areas_e)
-            areas_e *= 100
+        areas_h = np.array([_sum_abs2(m._h) for m in fields])
+        areas_h *= 100.0 / areas_h.sum(axis=1, keepdims=True)
 
-            areas_h = [np.sum(np.abs(h) ** 2) for h in h_fields]
-            areas_h /= np.sum(areas_h)
-            areas_h *= 100
+        fraction_te = areas_e[:, 0] / (areas_e[:, 0] + areas_e[:, 1])
+        fraction_tm = areas_e[:, 1] / (areas_e[:, 0] + areas_e[:, 1])
 
-            fraction_te.append(areas_e[0] / (areas_e[0] + areas_e[1]))
-            fraction_tm.append(areas_e[1] / (areas_e[0] + areas_e[1]))
+        mode_areas = np.hstack((areas_e, areas_h))
 
-            areas = areas_e.tolist()
-            areas.extend(areas_h)
-            mode_areas.append(areas)
-
-        return mode_areas, fraction_te, fraction_tm
+        return mode_areas, fraction_te.tolist(), fraction_tm.tolist()
 
     def write_modes_to_file(
         self,
@@ -781,30 +1116,42 @@ class ModeSolverFullyVectorial(_ModeSolver):
                 fs.write(line + "\n")
 
         # Mode field plots.
-        for i, (mode, areas) in enumerate(zip(self._ms.modes, self.overlaps)):
-            mode_directory = "%smode_%i/" % (modes_directory, i)
-            if not os.path.isdir(mode_directory):
-                os.mkdir(mode_directory)
-            filename_full = mode_directory + filename
+        mode_directories = [
+            "%smode_%i/" % (modes_directory, i) for i in range(len(self.modes))
+        ]
+        for mode_directory in mode_directories:
+            os.makedirs(mode_directory, exist_ok=True)
+
+        # Scratch buffers for the profiles being written, one per grid
+        # shape (the E and H components live on different grids).
+        profiles = {}
+
+        plots = []
+        for i, (mode, areas) in enumerate(zip(self.modes, self.overlaps)):
+            filename_parts = os.path.splitext(mode_directories[i] + filename)
 
             for (field_name, field_profile), area in zip(
                 mode.fields.items(), areas
             ):
                 if field_name in fields_to_write:
                     filename_mode = self._get_mode_filename(
-                        field_name, i, filename_full
-                    )
-                    self._write_mode_to_file(
-                        np.real(field_profile), filename_mode
+                        field_name, i, filename_parts
                     )
+                    shape = field_profile.shape
+                    if shape not in profiles:
+                        profiles[shape] = np.empty(shape, dtype=np.float32)
+                    profile = profiles[shape]
+                    np.copyto(profile, field_profile.real, casting="same_kind")
+                    self._write_mode_to_file(profile, filename_mode)
                     if plot:
-                        self._plot_mode(
-                            field_name,
-                            i,
-                            filename_mode,
-                            self.n_effs[i],
+                        plots.append(dict(
+                            field_name=field_name,
+                            mode_number=i,
+                            filename_mode=filename_mode,
+                            n_eff=self.n_effs[i],
                             area=area,
-                            wavelength=self._structure._wl,
-                        )
+                            wavelength=self._wavelength,
+                        ))
+        self._plot_modes(plots)
 
         return self.modes
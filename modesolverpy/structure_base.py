@@ -4,6 +4,7 @@ import os
 import sys
 import subprocess
 import abc
+import functools
 from six import with_metaclass
 
 try:
@@ -33,6 +34,10 @@ def use_matplotlib():
     global MPL
     MPL = True
 
+def _constant_n(n, wavelength):
+    # Module-level (rather than a lambda) so structures stay picklable.
+    return n
+
 class _AbstractStructure(with_metaclass(abc.ABCMeta)):
     @abc.abstractproperty
     def n(self):
@@ -370,7 +375,7 @@ class Slabs(_AbstractStructure):
         name = str(self.slab_count)
 
         if not callable(n_background):
-            n_back = lambda wl: n_background
+            n_back = functools.partial(_constant_n, n_background)
         else:
             n_back = n_background
 
@@ -662,11 +667,15 @@ class StructureAni():
 
     @property
     def eps_func(self):
-        return lambda x,y: tuple(axis.eps_func(x,y) for axis in self.axes)
+        # Build the per-axis interpolators now, so the returned function
+        # keeps the current profile even if the wavelength later changes.
+        eps_funcs = [axis.eps_func for axis in self.axes]
+        return lambda x,y: tuple(f(x,y) for f in eps_funcs)
 
     @property
     def n_func(self):
-        return lambda x,y: tuple(axis.n_func(x,y) for axis in self.axes)
+        n_funcs = [axis.n_func for axis in self.axes]
+        return lambda x,y: tuple(f(x,y) for f in n_funcs)
 
     def write_to_file(self, filename='material_index.dat', plot=True):
         '''
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+import modesolverpy.mode_solver as ms
+import modesolverpy.structure as st
+
+
+def _ridge(wavelength):
+    return st.RidgeWaveguide(wavelength, 0.05, 0.05, 0.3, 0.6, 0.5, 2.0,
+                             0.5, 1.45, 3.4, 90., 1.0, 0.5)
+
+
+@pytest.fixture(autouse=True)
+def _in_tmp_path(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+
+@pytest.mark.parametrize("make_solver", [
+    lambda: ms.ModeSolverSemiVectorial(1),
+    lambda: ms.ModeSolverSemiVectorial(4),
+    lambda: ms.ModeSolverFullyVectorial(4),
+])
+def test_warm_sweep_matches_cold_sweep(make_solver):
+    wavelengths = [1.5, 1.55, 1.6]
+    warm = make_solver().solve_sweep_wavelength(
+        _ridge(1.55), wavelengths, plot=False
+    )
+    cold = make_solver().solve_sweep_wavelength(
+        _ridge(1.55), wavelengths, plot=False, warm_start=False
+    )
+    np.testing.assert_allclose(warm, cold, rtol=1e-3)
+
+
+def test_fast_wavelength_sweep_matches_wavelength_sweep():
+    # The ridge's indices are constant, so ignoring dispersion is exact.
+    wavelengths = [1.5, 1.55, 1.6]
+    fast = ms.ModeSolverFullyVectorial(4).solve_sweep_wavelength_fast(
+        _ridge(1.55), wavelengths, plot=False
+    )
+    full = ms.ModeSolverFullyVectorial(4).solve_sweep_wavelength(
+        _ridge(1.55), wavelengths, plot=False
+    )
+    np.testing.assert_allclose(fast, full, rtol=1e-3)
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+from scipy.sparse import coo_matrix
+
+from modesolverpy import _mode_solver_lib as ms
+from modesolverpy import structure_base as stb
+
+
+def _n_core(wavelength):
+    return 3.48 + 0.1 * (1.55 - wavelength)
+
+
+def _slabs(wavelength):
+    s = stb.Slabs(wavelength, 0.05, 0.05, 1.5)
+    s.add_slab(0.4, 1.45)
+    s.add_slab(0.25, _n_core)
+    s.add_slab(0.4, 1.0)
+    return s
+
+
+def test_sparse_pattern_matches_coo():
+    rng = np.random.RandomState(0)
+    I = rng.randint(0, 20, 200)
+    J = rng.randint(0, 20, 200)
+    I[-1] = J[-1] = 19
+    V = rng.rand(200) + 1j * rng.rand(200)
+
+    expected = coo_matrix((V, (I, J))).tocsr()
+    actual = ms._SparsePattern(I, J).matrix(V)
+
+    assert actual.shape == expected.shape
+    assert abs(actual - expected).max() == 0
+
+
+@pytest.mark.parametrize("make_solver", [
+    lambda wl, s: ms._ModeSolverSemiVectorial(wl, s),
+    lambda wl, s: ms._ModeSolverVectorial(wl, s, '0000'),
+])
+def test_cached_solver_matches_fresh_solver(make_solver):
+    wl1, wl2 = 1.5, 1.6
+    s = _slabs(wl1)
+
+    cached = make_solver(wl1, s)
+    cached.build_matrix()
+    s.change_wavelength(wl2)
+    cached.update_wavelength(wl2, s)
+    fresh = make_solver(wl2, s)
+
+    assert abs(cached.build_matrix() - fresh.build_matrix()).max() == 0
+    np.testing.assert_allclose(
+        cached.solve(2).neff, fresh.solve(2).neff, rtol=1e-3
+    )